@@ -385,6 +385,223 @@ def load_level(level_map, difficulty_config):
     return walls, pellets, player_pos, player_spawn, ghosts
 
 
+# ============================================================
+# LEVEL GENERATION & VALIDATION (PURE FUNCTIONS)
+# ============================================================
+
+def bfs_distances(flat, cols, start):
+    """
+    Step distance from tile index start to every tile of a flattened map
+    (-1 = walled off). Single BFS, O(rows * cols).
+    """
+    n = len(flat)
+    dist = [-1] * n
+    dist[start] = 0
+    queue = [start]
+    for i in queue:
+        c = i % cols
+        # left/right neighbours must stay on the same row (no wrap-around)
+        for j in (i - 1 if c > 0 else -1, i + 1 if c < cols - 1 else -1, i - cols, i + cols):
+            if 0 <= j < n and dist[j] < 0 and flat[j] != "#":
+                dist[j] = dist[i] + 1
+                queue.append(j)
+    return dist
+
+
+def find_unreachable(level_map):
+    """Return (col, row) of every pellet/ghost tile that Pac-Man cannot reach."""
+    rows = len(level_map)
+    cols = len(level_map[0]) if rows else 0
+    flat = "".join(level_map)
+    start = flat.find("P")
+    if start < 0:
+        return [(i % cols, i // cols) for i, ch in enumerate(flat) if ch in ".G"]
+
+    dist = bfs_distances(flat, cols, start)
+    return [(i % cols, i // cols) for i, ch in enumerate(flat) if ch in ".G" and dist[i] < 0]
+
+
+def validate_level(level_map):
+    """True if the map is rectangular, has exactly one 'P' and no walled-off pellets/ghosts."""
+    if not level_map or any(len(row) != len(level_map[0]) for row in level_map):
+        return False
+    if sum(row.count("P") for row in level_map) != 1:
+        return False
+    return not find_unreachable(level_map)
+
+
+def level_density(level_map):
+    """Fraction of maze cells (odd row/col tiles) that are open, i.e. the achieved corridor_density."""
+    rows, cols = len(level_map), len(level_map[0])
+    cells = [level_map[r][c] for r in range(1, rows - 1, 2) for c in range(1, cols - 1, 2)]
+    return sum(ch != "#" for ch in cells) / len(cells)
+
+
+def generate_level(cols=27, rows=31, corridor_density=1.0, loop_ratio=0.1, ghost_count=4,
+                   ghost_min_distance=4, rng=None):
+    """
+    Build a random level in LEVEL_MAP format.
+    - A full maze (spanning tree over the odd tiles) is carved, then random dead
+      ends are pruned until exactly round(corridor_density * cells) cells stay
+      open (see level_density). Corners and a lattice of cells ~8 apart are
+      pruned last, so sparse levels keep spanning the whole map down to about
+      0.35-0.6 (depends on size); below that the maze starts to contract.
+    - loop_ratio (0..1) of the remaining walls between open cells are knocked out
+      to create cycles (a perfect maze is too easy for chasing ghosts).
+    - Even cols/rows: the last cell column/row is doubled, so there is no dead strip.
+    - Pac-Man is placed first, ghosts on open tiles at least ghost_min_distance
+      steps away (the farthest tiles if too few qualify); every other open tile
+      gets a pellet.
+    """
+    if cols < 3 or rows < 3:
+        raise ValueError("level must be at least 3x3")
+    if not 0 < corridor_density <= 1 or not 0 <= loop_ratio <= 1:
+        raise ValueError("corridor_density must be in (0, 1], loop_ratio in [0, 1]")
+    if ghost_count < 0 or ghost_min_distance < 1:
+        raise ValueError("ghost_count must be >= 0, ghost_min_distance >= 1")
+    rng = rng or random
+
+    wall, dot = ord("#"), ord(".")
+    grid = bytearray(b"#" * (cols * rows))
+    cw, ch = (cols - 1) // 2, (rows - 1) // 2  # cell grid (odd tiles)
+
+    def tile(cx, cy):
+        return (2 * cy + 1) * cols + 2 * cx + 1
+
+    def neighbours(cx, cy):
+        return [
+            (nx, ny)
+            for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1))
+            if 0 <= nx < cw and 0 <= ny < ch
+        ]
+
+    # --- carve: growing tree over all cells (spanning tree); extending the newest
+    # cell half the time gives long corridors, a random one keeps branches short
+    visited = bytearray(cw * ch)
+    degree = bytearray(cw * ch)
+    cx, cy = rng.randrange(cw), rng.randrange(ch)
+    visited[cy * cw + cx] = 1
+    grid[tile(cx, cy)] = dot
+    stack = [(cx, cy)]
+    while stack:
+        j = len(stack) - 1 if rng.random() < 0.5 else rng.randrange(len(stack))
+        cx, cy = stack[j]
+        options = [(nx, ny) for nx, ny in neighbours(cx, cy) if not visited[ny * cw + nx]]
+        if not options:
+            stack[j] = stack[-1]
+            stack.pop()
+            continue
+        nx, ny = rng.choice(options)
+        visited[ny * cw + nx] = 1
+        degree[cy * cw + cx] += 1
+        degree[ny * cw + nx] += 1
+        grid[tile(nx, ny)] = dot
+        grid[(tile(cx, cy) + tile(nx, ny)) // 2] = dot  # wall between the two cells
+        stack.append((nx, ny))
+
+    # --- thin: prune random dead ends until the target density is reached
+    carved = cw * ch
+    target = max(1, round(corridor_density * carved))
+    # anchor cells are pruned only once nothing else is left to prune, so down to
+    # that point the tree still connects them and reaches every region of the map
+    def lattice(n, step=8):
+        if n == 1:
+            return {0}
+        m = max(2, -(-(n - 1) // step) + 1)
+        return {round(i * (n - 1) / (m - 1)) for i in range(m)}
+
+    anchor_cols, anchor_rows = lattice(cw), lattice(ch)
+
+    def anchored(k):
+        return k % cw in anchor_cols and k // cw in anchor_rows
+
+    def prune(carved, keep):
+        leaves = [k for k in range(cw * ch) if visited[k] and degree[k] == 1 and not keep(k)]
+        while carved > target and leaves:
+            j = rng.randrange(len(leaves))
+            leaves[j], leaves[-1] = leaves[-1], leaves[j]
+            k = leaves.pop()
+            if not visited[k] or degree[k] != 1:
+                continue
+            cx, cy = k % cw, k // cw
+            for nx, ny in neighbours(cx, cy):
+                passage = (tile(cx, cy) + tile(nx, ny)) // 2
+                if visited[ny * cw + nx] and grid[passage] == dot:
+                    grid[passage] = wall
+                    degree[ny * cw + nx] -= 1
+                    if degree[ny * cw + nx] == 1 and not keep(ny * cw + nx):
+                        leaves.append(ny * cw + nx)
+                    break
+            grid[tile(cx, cy)] = wall
+            visited[k] = degree[k] = 0
+            carved -= 1
+        return carved
+
+    carved = prune(carved, anchored)
+    prune(carved, lambda k: False)
+
+    # --- loops: open some walls between two open cells
+    if loop_ratio > 0:
+        for cy in range(ch):
+            for cx in range(cw):
+                if not visited[cy * cw + cx]:
+                    continue
+                t = tile(cx, cy)
+                if cx + 1 < cw and visited[cy * cw + cx + 1] and grid[t + 1] == wall:
+                    if rng.random() < loop_ratio:
+                        grid[t + 1] = dot
+                if cy + 1 < ch and visited[(cy + 1) * cw + cx] and grid[t + cols] == wall:
+                    if rng.random() < loop_ratio:
+                        grid[t + cols] = dot
+
+    # --- even sizes: copy the last cell column/row into the spare one
+    # (each copied tile sits next to its open original, so connectivity holds)
+    if cols % 2 == 0:
+        for r in range(1, rows - 1):
+            grid[r * cols + cols - 2] = grid[r * cols + cols - 3]
+    if rows % 2 == 0:
+        for c in range(1, cols - 1):
+            grid[(rows - 2) * cols + c] = grid[(rows - 3) * cols + c]
+
+    # --- spawns: Pac-Man first, ghosts away from him
+    open_tiles = [i for i, b in enumerate(grid) if b == dot]
+    if len(open_tiles) < ghost_count + 1:
+        raise ValueError("not enough open tiles for Pac-Man and %d ghosts" % ghost_count)
+    player = rng.choice(open_tiles)
+    grid[player] = ord("P")
+    dist = bfs_distances(grid.decode("ascii"), cols, player)
+    far = [i for i in open_tiles if i != player and dist[i] >= ghost_min_distance]
+    if len(far) >= ghost_count:
+        ghost_tiles = rng.sample(far, ghost_count)
+    else:
+        ghost_tiles = sorted((i for i in open_tiles if i != player), key=lambda i: -dist[i])[:ghost_count]
+    for i in ghost_tiles:
+        grid[i] = ord("G")
+
+    text = grid.decode("ascii")
+    return [text[r * cols:(r + 1) * cols] for r in range(rows)]
+
+
+def generate_levels(count, seed=None, max_attempts=10, **params):
+    """
+    Batch generation for benchmarks/sweeps: same seed -> same list of levels.
+    Each level is checked with validate_level and regenerated if it fails.
+    params are passed to generate_level (cols, rows, corridor_density, loop_ratio,
+    ghost_count, ghost_min_distance).
+    """
+    rng = random.Random(seed)
+    levels = []
+    for _ in range(count):
+        for _ in range(max_attempts):
+            level_map = generate_level(rng=rng, **params)
+            if validate_level(level_map):
+                levels.append(level_map)
+                break
+        else:
+            raise RuntimeError("could not generate a valid level in %d attempts" % max_attempts)
+    return levels
+
+
 # ============================================================
 # GAME CLASS (MODULAR)
 # ============================================================
@@ -659,7 +876,22 @@ class Game:
 # ============================================================
 
 def main():
-    game = Game(LEVEL_MAP, DIFFICULTIES, CONFIG)
+    level_map = LEVEL_MAP
+    # python . --random [seed] -> play on a generated (validated) level
+    if len(sys.argv) > 1 and sys.argv[1] == "--random":
+        try:
+            seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        except ValueError:
+            print("usage: python . [--random [SEED]]  (SEED must be an integer)", file=sys.stderr)
+            sys.exit(2)
+        level_map = generate_levels(1, seed=seed)[0]
+    elif not validate_level(level_map):
+        print(
+            "warning: LEVEL_MAP has %d unreachable pellet/ghost tiles, the level cannot be won"
+            % len(find_unreachable(level_map)),
+            file=sys.stderr,
+        )
+    game = Game(level_map, DIFFICULTIES, CONFIG)
     game.run()
 
 
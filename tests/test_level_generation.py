@@ -0,0 +1,99 @@
+import importlib.util
+import os
+import random
+import sys
+import types
+from unittest import mock
+
+import pytest
+
+# The game module imports pygame at top level; the level functions don't need it,
+# so stub it only while loading the module and only if it isn't installed.
+try:
+    import pygame  # noqa: F401
+    _stubs = {}
+except ImportError:
+    _stubs = {"pygame": types.ModuleType("pygame")}
+
+_spec = importlib.util.spec_from_file_location(
+    "pacman_game", os.path.join(os.path.dirname(__file__), "..", "__main__.py")
+)
+game = importlib.util.module_from_spec(_spec)
+with mock.patch.dict(sys.modules, _stubs):
+    _spec.loader.exec_module(game)
+
+
+def test_level_with_walled_off_corridor_is_invalid():
+    level_map = [
+        "#########",
+        "#..P..G.#",
+        "#.#######",
+        "#...#...#",
+        "#########",
+    ]
+    assert game.validate_level(level_map[:3] + ["#.......#", level_map[4]])
+    assert not game.validate_level(level_map)
+
+
+def test_walled_off_pellet_is_reported():
+    # (0, 2) follows the reachable (4, 1) in the flattened map; the BFS must not wrap rows
+    level_map = [
+        "#####",
+        "#..P.",
+        ".####",
+    ]
+    assert game.find_unreachable(level_map) == [(0, 2)]
+    assert not game.validate_level(level_map)
+
+
+def test_same_seed_gives_same_levels():
+    assert game.generate_levels(20, seed=42) == game.generate_levels(20, seed=42)
+    assert game.generate_levels(5, seed=1) != game.generate_levels(5, seed=2)
+
+
+@pytest.mark.parametrize("cols", [7, 20, 27])
+@pytest.mark.parametrize("rows", [5, 12, 31])
+@pytest.mark.parametrize("corridor_density", [0.3, 0.7, 1.0])
+@pytest.mark.parametrize("loop_ratio", [0.0, 0.5])
+def test_generated_levels_are_valid(cols, rows, corridor_density, loop_ratio):
+    levels = game.generate_levels(
+        10, seed=7, cols=cols, rows=rows, corridor_density=corridor_density,
+        loop_ratio=loop_ratio, ghost_count=2,
+    )
+    for level_map in levels:
+        assert len(level_map) == rows and all(len(row) == cols for row in level_map)
+        assert game.validate_level(level_map)
+        assert sum(row.count("G") for row in level_map) == 2
+
+
+def test_ghosts_spawn_away_from_pacman():
+    for level_map in game.generate_levels(200, seed=5):
+        flat = "".join(level_map)
+        dist = game.bfs_distances(flat, len(level_map[0]), flat.index("P"))
+        assert all(dist[i] >= 4 for i, ch in enumerate(flat) if ch == "G")
+
+
+def test_zero_ghost_distance_never_overwrites_pacman():
+    rng = random.Random(0)
+    for _ in range(200):
+        level_map = game.generate_level(cols=5, rows=5, ghost_count=2, ghost_min_distance=1, rng=rng)
+        assert game.validate_level(level_map)
+    with pytest.raises(ValueError):
+        game.generate_level(ghost_min_distance=0)
+
+
+def test_density_is_honoured_and_monotonic():
+    densities = [0.1, 0.2, 0.3, 0.5, 0.7, 1.0]
+    achieved = [
+        game.level_density(game.generate_levels(1, seed=3, loop_ratio=0, corridor_density=d)[0])
+        for d in densities
+    ]
+    assert achieved == sorted(set(achieved))
+    cells = 13 * 15
+    assert achieved == [round(d * cells) / cells for d in densities]
+
+
+@pytest.mark.parametrize("kwargs", [{"ghost_count": -1}, {"ghost_min_distance": -2}])
+def test_bad_ghost_arguments_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        game.generate_levels(1, **kwargs)